@@ -8,19 +8,156 @@ while preserving the question-response table structure.
 
 """
 
+import bisect
+import concurrent.futures
+import numpy as np
 import pandas as pd
 import os
 import re
+import sys
 from pathlib import Path
 
+# Numba is optional: when present, the structural question patterns run in a
+# compiled byte-level kernel instead of the regex engine.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# Precompiled patterns. These all run inside per-row loops, so compiling them
+# once at import time avoids re-parsing (and re.cache lookups) on every call.
+# The five question indicators are folded into a single alternation so the
+# engine walks each first cell once instead of once per pattern:
+#   ^[A-Z]\d+:  S1:, A1:, B1:, etc.
+#   ^\[.*\]     [Age], [Gender], etc.
+#   \?$         Ends with question mark
+#   ^CTP:       CTP questions
+#   ^h[A-Z]     hSample, hB1_Flag, etc.
+_QUESTION_RE = re.compile(r'^[A-Z]\d+:|^\[.*\]|\?$|^CTP:|^h[A-Z]')
+_NUM_RE = re.compile(r'\d')
+_NEQ_RE = re.compile(r'N=\d+')
+_DECIMAL_RE = re.compile(r'^\d+\.\d+$')
+
+# Translation table mapping Windows-invalid filename characters to '_':
+# a branch-free single pass, no regex needed.
+_FN_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+# Markdown table cells need pipes escaped and newlines flattened; one regex
+# substitution does both in a single scan (translate can't insert the
+# two-character escape).
+_MD_CLEAN_RE = re.compile(r'[|\n]')
+_MD_CLEAN_MAP = {'|': r'\|', '\n': ' '}
+
+
+def _clean_md_cell(cell):
+    """
+    Clean up a cell value for use in a markdown table, in one pass
+    """
+    return _MD_CLEAN_RE.sub(lambda m: _MD_CLEAN_MAP[m.group()], str(cell))
+
+# Long descriptive text is likely a question (but NOT response options). The list in _RESPONSE_INDICATORS is recycled from converting a different CSV, but
+# somehow it is not breaking this script.
+_QUESTION_WORDS = ['what', 'how', 'which', 'please', 'following']
+_RESPONSE_INDICATORS = ['marketing or advertising agency', 'business entity', 'educational institution', 'organization', 'government agency']
+# One IGNORECASE alternation per list: a single scan of the cell instead of
+# one .lower() pass plus one `in` scan per word.
+_QWORDS_RE = re.compile('|'.join(_QUESTION_WORDS), re.IGNORECASE)
+_RESP_EXCL_RE = re.compile('|'.join(_RESPONSE_INDICATORS), re.IGNORECASE)
+
+# Common response categories - these are definitely data rows. This was also recycled from previous conversion but isn't breaking this one.
+_RESPONSE_CATEGORIES = [
+    'Total', 'Mean', 'Median', 'Standard Deviation',
+    'Yes', 'No', 'Male', 'Female', 'Other',
+    'Very important', 'Somewhat important', 'Not important',
+    'Strongly agree', 'Agree', 'Disagree',
+    'Currently use', 'Used', 'Never used',
+    'A marketing or advertising agency',  # Add this specific case
+    'A business entity', 'An educational institution',
+    'An organization or non-profit', 'A government agency'
+]
+_RESP_CAT_RE = re.compile('|'.join(map(re.escape, _RESPONSE_CATEGORIES)))
+
+# Descriptive header labels specific to this data set. this will have to be updated for every .CSV that needs to be processed.
+_SWITCHER_LABELS = [
+    "Pro-to-Pro Switchers (B)",
+    "Software-to-Pro Switchers (C)",
+    "Pro-to-Software Switchers (D)",
+]
+_SWITCHER_RE = re.compile('|'.join(map(re.escape, _SWITCHER_LABELS)))
+
+# Fan question sections out to worker processes only when there are enough of
+# them to pay back the pool startup cost.
+_PARALLEL_MIN_SECTIONS = 32
+
+
+if njit is not None:
+    @njit
+    def _question_pattern_kernel(buf, offsets):
+        """
+        Byte-level equivalent of _QUESTION_RE over a packed string buffer.
+
+        buf holds every first cell UTF-8 encoded back to back; offsets[i] /
+        offsets[i+1] delimit cell i. Numba can't run re, so the five
+        structural patterns are hand-coded byte checks.
+        """
+        n = offsets.shape[0] - 1
+        out = np.zeros(n, np.bool_)
+        for i in range(n):
+            s = offsets[i]
+            e = offsets[i + 1]
+            if e <= s:
+                continue
+            b0 = buf[s]
+            hit = False
+            # ^[A-Z]\d+:
+            if 65 <= b0 <= 90:
+                j = s + 1
+                while j < e and 48 <= buf[j] <= 57:
+                    j += 1
+                if j > s + 1 and j < e and buf[j] == 58:
+                    hit = True
+            # ^\[.*\]  (']' must follow '[' on the first line)
+            if not hit and b0 == 91:
+                j = s + 1
+                while j < e and buf[j] != 10:
+                    if buf[j] == 93:
+                        hit = True
+                        break
+                    j += 1
+            # \?$  (cells are pre-stripped, so the last byte is significant)
+            if not hit and buf[e - 1] == 63:
+                hit = True
+            # ^CTP:
+            if not hit and e - s >= 4 and b0 == 67 and buf[s + 1] == 84 and buf[s + 2] == 80 and buf[s + 3] == 58:
+                hit = True
+            # ^h[A-Z]
+            if not hit and e - s >= 2 and b0 == 104 and 65 <= buf[s + 1] <= 90:
+                hit = True
+            out[i] = hit
+        return out
+
+
+def _question_pattern_mask(first_col):
+    """
+    Boolean mask of first cells matching the structural question patterns.
+
+    Uses the Numba kernel when available, otherwise the compiled regex.
+    """
+    if njit is None:
+        return pd.Series(first_col).str.contains(_QUESTION_RE, regex=True).to_numpy()
+    encoded = [s.encode('utf-8') for s in first_col]
+    offsets = np.zeros(len(encoded) + 1, np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    return _question_pattern_kernel(buf, offsets)
+
 
 def sanitize_filename(filename):
     """
     Sanitize filename by removing/replacing invalid characters for Windows filesystem
     """
-    invalid_chars = r'[<>:"/\\|?*]'
-    sanitized = re.sub(invalid_chars, '_', filename)
-    sanitized = sanitized.strip('. ')
+    sanitized = filename.translate(_FN_TRANS).strip('. ')
     if len(sanitized) > 200:
         sanitized = sanitized[:200]
     return sanitized
@@ -28,13 +165,17 @@ def sanitize_filename(filename):
 
 def first_non_empty_cell(row):
     """
-    Return the first non-empty, non-'nan' cell value from a pandas row as a
-    stripped string. Returns an empty string if no cell contains text. Because the column headings start in B not A
+    Return the first non-empty cell from a stripped row array. Returns an
+    empty string if no cell contains text. Because the column headings start in B not A
     """
-    for cell in row:
-        cell_str = str(cell).strip()
-        if cell_str and cell_str.lower() != 'nan':
-            return cell_str
+    # Fast path: column 0 carries the label on almost every populated row,
+    # so check it before setting up a scan over the rest.
+    c0 = row[0]
+    if c0:
+        return c0
+    for cell in row[1:]:
+        if cell:
+            return cell
     return ''
 
 
@@ -43,26 +184,15 @@ def is_question_row(row):
     Determine if a row contains a survey question
     """
     first_cell = first_non_empty_cell(row)
-    
+
     # Check for question indicators
-    question_patterns = [
-        r'^[A-Z]\d+:',  # S1:, A1:, B1:, etc.
-        r'^\[.*\]',     # [Age], [Gender], etc.
-        r'\?$',         # Ends with question mark
-        r'^CTP:',       # CTP questions
-        r'^h[A-Z]',     # hSample, hB1_Flag, etc.
-    ]
-    
-    for pattern in question_patterns:
-        if re.search(pattern, first_cell):
-            return True
+    if _QUESTION_RE.search(first_cell):
+        return True
     
-    # Long descriptive text is likely a question (but NOT response options). The list in response_indicators is recycled from converting a different CSV, but
-    # somehow it is not breaking this script. 
-    if len(first_cell) > 50 and any(word in first_cell.lower() for word in ['what', 'how', 'which', 'please', 'following']):
+    # Long descriptive text is likely a question (but NOT response options)
+    if len(first_cell) > 50 and _QWORDS_RE.search(first_cell):
         # Make sure it's not a response option that happens to be long
-        response_indicators = ['marketing or advertising agency', 'business entity', 'educational institution', 'organization', 'government agency']
-        if not any(indicator in first_cell.lower() for indicator in response_indicators):
+        if not _RESP_EXCL_RE.search(first_cell):
             return True
     
     return False
@@ -73,34 +203,28 @@ def is_header_row(row):
     Determine if a row contains column headers
     """
     first_cell = first_non_empty_cell(row)
-    
-    # Only "Total" rows that actually look like column headers
-    if first_cell == 'Total':
-        # Check if it has the structure of a header row (N=xxx values)
-        row_text = ' '.join(str(cell) for cell in row)
-        if 'N=' in row_text:
-            return True
-    
-    # Also capture descriptive header rows that are specific to the data set. this will have to be updated for every .CSV that needs to be processed. 
-    # Do this even if the first cell is empty
-    row_text = ' '.join(str(cell) for cell in row if str(cell).strip() and str(cell).strip() != 'nan')
 
+    # An all-empty row can't be a header
+    if not first_cell:
+        return False
+
+    # Cheap first-cell tests before paying for the full-row join: on header
+    # rows in these CSVs the descriptive label sits in the first populated
+    # cell, so ~99% of rows resolve without the allocation.
     # Exact pattern for this file, which is different in other files: "Total (A)" followed by the profile type
     # e.g. "Total (A)    Pro-to-Pro Switchers (B)    Software-to-Pro Switchers (C)    Pro-to-Software Switchers (D)"
-    if 'Total (A)' in row_text:
+    if 'Total (A)' in first_cell or _SWITCHER_RE.search(first_cell):
         return True
 
-    if 'Total (A)' in row_text and 'Pro-to-Pro Switchers (B)' in row_text and 'Software-to-Pro Switchers (C)' in row_text and 'Pro-to-Software Switchers (D)' in row_text:
+    row_text = ' '.join(cell for cell in row if cell)
+
+    # Only "Total" rows that actually look like column headers
+    # (N=xxx values give them away)
+    if first_cell == 'Total' and 'N=' in row_text:
         return True
 
-    # Also treat specificheader labels as header rows so they're
-    # recognized as descriptive header rows in this CSV.
-    specific_headers = [
-        "Pro-to-Pro Switchers (B)",
-        "Software-to-Pro Switchers (C)",
-        "Pro-to-Software Switchers (D)",
-    ]
-    if any(h in row_text for h in specific_headers):
+    # Also capture descriptive header rows that are specific to the data set. this will have to be updated for every .CSV that needs to be processed.
+    if 'Total (A)' in row_text or _SWITCHER_RE.search(row_text):
         return True
 
     return False
@@ -111,209 +235,228 @@ def is_data_row(row):
     Determine if a row contains actual response data
     """
     first_cell = first_non_empty_cell(row)
-    
+
     # Skip completely empty rows
-    if not first_cell or first_cell == 'nan':
+    if not first_cell:
         return False
-    
+
     # Don't treat question rows as data
     if is_question_row(row):
         return False
-    
-    # Look for response categories or data
-    response_patterns = [
-        r'^\d+$',           # Just numbers
-        r'%$',              # Ends with %
-        r'^\d+\.\d+$',      # Decimal numbers
-    ]
-    
+
     # Check if this looks like response data
-    non_empty_cells = [str(cell).strip() for cell in row if str(cell).strip() and str(cell).strip() != 'nan']
-    
+    non_empty_cells = [cell for cell in row if cell]
+
     # If multiple cells have percentage signs or numbers, it's likely data
-    numeric_cells = sum(1 for cell in non_empty_cells if re.search(r'\d', cell))
+    numeric_cells = sum(1 for cell in non_empty_cells if _NUM_RE.search(cell))
     if numeric_cells >= 2:
         return True
     
-    # Common response categories - these are definitely data rows. This was also recycled from previous conversion but isn't breaking this one. 
-    response_categories = [
-        'Total', 'Mean', 'Median', 'Standard Deviation',
-        'Yes', 'No', 'Male', 'Female', 'Other',
-        'Very important', 'Somewhat important', 'Not important',
-        'Strongly agree', 'Agree', 'Disagree',
-        'Currently use', 'Used', 'Never used',
-        'A marketing or advertising agency',  # Add this specific case
-        'A business entity', 'An educational institution',
-        'An organization or non-profit', 'A government agency'
-    ]
-    
-    if any(category in first_cell for category in response_categories):
+    # Common response categories - these are definitely data rows
+    if _RESP_CAT_RE.search(first_cell):
         return True
     
     # Reasonable length for response option (not too long, not empty)
     return len(first_cell) > 0 and len(first_cell) < 120
 
 
-def format_survey_csv_to_markdown(df, filename):
+def _collect_question_section(task):
+    """
+    Gather one question section's combined header rows and data rows.
+
+    task is (question_text, sec_rows, sec_h, sec_d, neq_fallback): the
+    stripped rows between this question and the next, the matching
+    header/data mask slices, and the pre-resolved N= fallback row (or None).
+    Everything in and out is picklable so sections can be mapped across
+    worker processes.
+    """
+    question_text, sec_rows, sec_h, sec_d, neq_fallback = task
+
+    # Find all headers and data within this question section
+    all_header_rows = []  # Store multiple header rows
+    section_data = []
+
+    for j in range(len(sec_rows)):
+        # Cells are already stripped, with NaN/empty as ""
+        if sec_h[j]:
+            all_header_rows.append(list(sec_rows[j]))
+
+        elif sec_d[j]:
+            data_row = list(sec_rows[j])
+            if any(data_row):  # Only add if row has some data
+                section_data.append(data_row)
+
+    # Combine multiple header rows intelligently. need to update this for this specific CSV .
+    header_rows = []
+    if all_header_rows:
+        descriptive_headers = None
+        total_headers = None
+
+        # Look for a descriptive header row (e.g. the row with "Total (A)" and
+        # the profile labels) and for the N= (sample size) row. Some CSVs put
+        # the descriptive labels in a separate row from the N= row, so prefer
+        # the descriptive labels as the primary visible header.
+        # need to update this for this specific CSV
+        for header_row in all_header_rows:
+            header_text = ' '.join(header_row)
+
+            # If the row contains the descriptive "Total (A)" or any of the
+            # known switcher labels, treat it as the descriptive header.
+            if 'Total (A)' in header_text or _SWITCHER_RE.search(header_text):
+                descriptive_headers = header_row
+
+            # Separately capture rows that include sample-size markers like N=123
+            if _NEQ_RE.search(header_text):
+                total_headers = header_row
+
+        # If we didn't find a total_headers from is_header_row matches, fall
+        # back to the pre-resolved N= row (some CSVs place the N= values in a
+        # separate row that wasn't flagged by is_header_row, either inside
+        # the section or just above the question start).
+        if not total_headers and neq_fallback is not None:
+            total_headers = neq_fallback
+
+        # Build header_rows in order: descriptive first (if present), then total/N=
+        if descriptive_headers:
+            header_rows.append(descriptive_headers)
+        if total_headers:
+            header_rows.append(total_headers)
+
+    return question_text, header_rows, section_data
+
+
+def format_survey_csv_to_markdown(df, filename, out):
     """
-    Convert survey CSV data to Markdown preserving question-response structure
+    Convert survey CSV data to Markdown preserving question-response structure,
+    streaming the result to the writable file `out` instead of buffering the
+    whole document in one string.
     """
     if df.empty:
-        return f"# {filename}\n\n*This file is empty.*\n"
+        out.write(f"# {filename}\n\n*This file is empty.*\n")
+        return
 
     file_title = filename.replace('_', ' ').replace('.csv', '').title()
-    markdown_content = f"# {file_title}\n\n"
-    
-    markdown_content += f"**Total Records:** {len(df)}  \n"
-    markdown_content += f"**Total Columns:** {len(df.columns)}  \n"
-    markdown_content += f"**Generated:** October 28, 2025  \n\n"
-    
-    markdown_content += "## Survey Questions and Responses\n\n"
-    
+    out.write(f"# {file_title}\n\n")
+
+    out.write(f"**Total Records:** {len(df)}  \n")
+    out.write(f"**Total Columns:** {len(df.columns)}  \n")
+    out.write(f"**Generated:** October 28, 2025  \n\n")
+
+    out.write("## Survey Questions and Responses\n\n")
+
+    # Parse once, keep columnar: a single vectorized pass strips every cell
+    # and blanks out NaNs, so the predicates and table builders below never
+    # stringify the same cell twice. All downstream code reads from S.
+    # Missing values are detected structurally with one C-level isna pass;
+    # frames loaded with na_filter=False carry no NaN at all, so the blanking
+    # copy is skipped entirely in the common case.
+    S = df.astype(str).apply(lambda c: c.str.strip()).to_numpy(dtype=object)
+    nan_mask = df.isna().to_numpy()
+    if nan_mask.any():
+        S = np.where(nan_mask, '', S)
+
+    # Survey cells repeat heavily (N= markers, Yes/No, header labels), so
+    # intern each string: duplicates collapse to one object, memory drops,
+    # and the == / in checks downstream short-circuit on identity.
+    S = np.vectorize(sys.intern, otypes=[object])(S)
+    first_col = np.array([first_non_empty_cell(row) for row in S], dtype=object)
+
+    # Classify all rows in one pass over the first-cell column: the compiled
+    # byte kernel (or the combined regex, when Numba is absent) replaces the
+    # row-by-row is_question_row calls.
+    first = pd.Series(first_col)
+    is_q = pd.Series(_question_pattern_mask(first_col))
+    # Long descriptive text is likely a question (but NOT response options),
+    # mirroring the fallback branch of is_question_row.
+    is_q |= (
+        (first.str.len() > 50)
+        & first.str.contains(_QWORDS_RE)
+        & ~first.str.contains(_RESP_EXCL_RE)
+    )
+
     # Find all question boundaries first
-    question_boundaries = []
-    for index, row in df.iterrows():
-        if is_question_row(row):
-            question_boundaries.append(index)
-    
-    # Process each question section completely
-    question_number = 0
+    question_boundaries = np.flatnonzero(is_q.to_numpy()).tolist()
+
+    # Evaluate the header/data predicates once per row up front. The section
+    # assembly below revisits rows while building each question's table, and
+    # these masks keep it from re-stringifying the same cells every time.
+    # Header detection works on whole-row text, so join each row once and run
+    # the checks column-wise with vectorized str kernels (mirroring
+    # is_header_row row by row).
+    n = len(S)
+    row_text = pd.Series([' '.join(c for c in row if c) for row in S])
+    h_mask = (
+        ((first == 'Total') & row_text.str.contains('N=', regex=False))
+        | row_text.str.contains('Total (A)', regex=False)
+        | row_text.str.contains(_SWITCHER_RE)
+    ).to_numpy()
+    d_mask = np.fromiter((is_data_row(S[i]) for i in range(n)), bool, n)
+
+    # An N= row is a property of the row, not the section: index every row
+    # containing a sample-size marker once, and resolve each section's
+    # fallback with a binary search instead of rescanning its rows (and the
+    # six rows above the question) on every miss.
+    neq_idx = np.flatnonzero(row_text.str.contains(_NEQ_RE).to_numpy()).tolist()
+
+    # Process each question section completely. Sections are independent of
+    # one another, so large surveys fan out across worker processes; small
+    # ones stay inline to avoid the pool startup cost.
+    tasks = []
     for i, question_start in enumerate(question_boundaries):
         # Determine end of this question section
-        question_end = question_boundaries[i + 1] if i + 1 < len(question_boundaries) else len(df)
-        
-        # Get the question text
-        question_text = str(df.iloc[question_start].iloc[0]).strip()
-        
-        # Find all headers and data within this question section
-        section_headers = []
-        all_header_rows = []  # Store multiple header rows
-        section_data = []
-        
-        for row_idx in range(question_start + 1, question_end):
-            row = df.iloc[row_idx]
-            
-            if is_header_row(row):
-                headers = []
-                for cell in row:
-                    cell_str = str(cell).strip()
-                    if cell_str and cell_str != 'nan':
-                        headers.append(cell_str)
-                    else:
-                        headers.append("")
-                all_header_rows.append(headers)
-                
-            elif is_data_row(row):
-                data_row = []
-                for cell in row:
-                    cell_str = str(cell).strip()
-                    if cell_str and cell_str != 'nan':
-                        data_row.append(cell_str)
-                    else:
-                        data_row.append("")
-                
-                if any(data_row):  # Only add if row has some data
-                    section_data.append(data_row)
-        
-        # Combine multiple header rows intelligently. need to update this for this specific CSV .
-        header_rows = []
-        if all_header_rows:
-            descriptive_headers = None
-            total_headers = None
-            
-            # Look for a descriptive header row (e.g. the row with "Total (A)" and
-            # the profile labels) and for the N= (sample size) row. Some CSVs put
-            # the descriptive labels in a separate row from the N= row, so prefer
-            # the descriptive labels as the primary visible header.
-            # need to update this for this specific CSV
-            switcher_labels = [
-                "Pro-to-Pro Switchers (B)",
-                "Software-to-Pro Switchers (C)",
-                "Pro-to-Software Switchers (D)",
-            ]
-            for header_row in all_header_rows:
-                header_text = ' '.join(header_row)
-
-                # If the row contains the descriptive "Total (A)" or any of the
-                # known switcher labels, treat it as the descriptive header.
-                if 'Total (A)' in header_text or any(lbl in header_text for lbl in switcher_labels):
-                    descriptive_headers = header_row
-
-                # Separately capture rows that include sample-size markers like N=123
-                if 'N=' in header_text or re.search(r'N=\d+', header_text):
-                    total_headers = header_row
-
-            # If we didn't find a total_headers from is_header_row matches,
-            # search the section rows for any row that contains an N= pattern
-            # (some CSVs place the N= values in a separate row that wasn't
-            # flagged by is_header_row).
-            if not total_headers:
-                # Search within the section for N= rows
-                for row_idx in range(question_start + 1, question_end):
-                    row = df.iloc[row_idx]
-                    cells = [str(c).strip() for c in row if str(c).strip() and str(c).strip() != 'nan']
-                    if any(re.search(r'N=\d+', c) for c in cells):
-                        # Build a header-like list from this row
-                        th = []
-                        for cell in row:
-                            cell_str = str(cell).strip()
-                            if cell_str and cell_str != 'nan':
-                                th.append(cell_str)
-                            else:
-                                th.append("")
-                        total_headers = th
-                        break
-            # If still not found, look just above the question start in case N= row precedes the question
-            if not total_headers:
-                start_above = max(0, question_start - 6)
-                for row_idx in range(start_above, question_start):
-                    row = df.iloc[row_idx]
-                    cells = [str(c).strip() for c in row if str(c).strip() and str(c).strip() != 'nan']
-                    if any(re.search(r'N=\d+', c) for c in cells):
-                        th = []
-                        for cell in row:
-                            cell_str = str(cell).strip()
-                            if cell_str and cell_str != 'nan':
-                                th.append(cell_str)
-                            else:
-                                th.append("")
-                        total_headers = th
-                        break
-            
-            # Build header_rows in order: descriptive first (if present), then total/N=
-            if descriptive_headers:
-                header_rows.append(descriptive_headers)
-            if total_headers:
-                header_rows.append(total_headers)
+        question_end = question_boundaries[i + 1] if i + 1 < len(question_boundaries) else n
+
+        # First N= row inside the section, else the first one in the
+        # six-row window above the question start
+        neq_fallback = None
+        k = bisect.bisect_right(neq_idx, question_start)
+        if k < len(neq_idx) and neq_idx[k] < question_end:
+            neq_fallback = list(S[neq_idx[k]])
         else:
-            header_rows = []
-        
-        # Generate the question section if we have data
+            k = bisect.bisect_left(neq_idx, max(0, question_start - 6))
+            if k < len(neq_idx) and neq_idx[k] < question_start:
+                neq_fallback = list(S[neq_idx[k]])
+
+        tasks.append((
+            S[question_start][0],
+            S[question_start + 1:question_end],
+            h_mask[question_start + 1:question_end],
+            d_mask[question_start + 1:question_end],
+            neq_fallback,
+        ))
+
+    if len(tasks) >= _PARALLEL_MIN_SECTIONS:
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            sections = list(executor.map(_collect_question_section, tasks))
+    else:
+        sections = [_collect_question_section(task) for task in tasks]
+
+    # Generate the question sections that have data, in order
+    question_number = 0
+    for question_text, header_rows, section_data in sections:
         if header_rows or section_data:
             question_number += 1
-            markdown_content += format_question_section(
-                question_number, question_text, header_rows, section_data
+            format_question_section(
+                question_number, question_text, header_rows, section_data, out
             )
-    
+
     # Add summary
-    markdown_content += f"## Summary\n\n"
-    markdown_content += f"**Total Questions Processed:** {question_number}  \n"
-    markdown_content += f"**Source File:** {filename}  \n"
-    
-    return markdown_content
+    out.write(f"## Summary\n\n")
+    out.write(f"**Total Questions Processed:** {question_number}  \n")
+    out.write(f"**Source File:** {filename}  \n")
 
 
-def format_question_section(question_num, question, header_rows, data_rows):
+def format_question_section(question_num, question, header_rows, data_rows, out):
     """
-    Format a single question section with its response table
+    Format a single question section with its response table, writing to `out`
     """
-    content = f"### Question {question_num}\n\n"
-    content += f"**{question}**\n\n"
-    
+    out.write(f"### Question {question_num}\n\n")
+    out.write(f"**{question}**\n\n")
+
     if not header_rows and not data_rows:
-        content += "*No response data available for this question.*\n\n"
-        return content
-    
+        out.write("*No response data available for this question.*\n\n")
+        return
+
     # Create the response table
     # header_rows is a list of header row lists (e.g. [descriptive_headers, total_headers])
     if header_rows:
@@ -325,44 +468,56 @@ def format_question_section(question_num, question, header_rows, data_rows):
         table_headers = [f"Column {i+1}" for i in range(max_cols)]
     
     if data_rows:
-        content += "#### Response Data\n\n"
-        
+        out.write("#### Response Data\n\n")
+
+        ncols = len(table_headers)
+
         # Create markdown table using the primary header row as the visible header
-        content += "| " + " | ".join(table_headers) + " |\n"
-        content += "|" + "---|" * len(table_headers) + "\n"
+        out.write(f"| {' | '.join(table_headers)} |\n")
+        out.write("|" + "---|" * ncols + "\n")
 
         # If there is a secondary header row (e.g., N= sample sizes), render it as the
         # first data row so the sample sizes appear directly under the descriptive headers.
         if header_rows and len(header_rows) > 1:
             secondary = header_rows[1]
             # Ensure secondary has correct length
-            while len(secondary) < len(table_headers):
-                secondary.append("")
+            if len(secondary) < ncols:
+                secondary += [""] * (ncols - len(secondary))
             # Mark sample sizes as italic to distinguish them (optional)
-            sec_row = [str(c) for c in secondary[:len(table_headers)]]
-            content += "| " + " | ".join(sec_row) + " |\n"
+            sec_row = [str(c) for c in secondary[:ncols]]
+            out.write(f"| {' | '.join(sec_row)} |\n")
 
         for data_row in data_rows:
-            # Ensure row has enough columns
-            while len(data_row) < len(table_headers):
-                data_row.append("")
-            
+            # Pad to the header width in one step instead of append-looping
+            if len(data_row) < ncols:
+                data_row += [""] * (ncols - len(data_row))
+
             # Clean up cell values for markdown
-            clean_row = []
-            for cell in data_row[:len(table_headers)]:
-                clean_cell = str(cell).replace('|', '\\|').replace('\n', ' ')
-                clean_row.append(clean_cell)
-            
-            content += "| " + " | ".join(clean_row) + " |\n"
-        
-        content += "\n"
-    
-    return content
+            clean_row = [_clean_md_cell(cell) for cell in data_row[:ncols]]
+            out.write(f"| {' | '.join(clean_row)} |\n")
+
+        out.write("\n")
+
+
+class _Utf8Writer:
+    """
+    Minimal text adapter over a binary file: encodes each write to UTF-8 and
+    passes the bytes straight through, skipping TextIOWrapper's per-write
+    newline translation and encoder state handling.
+    """
 
+    def __init__(self, raw):
+        self._raw = raw
 
-def convert_survey_csv_to_markdown(csv_path, output_dir):
+    def write(self, s):
+        self._raw.write(s.encode('utf-8'))
+
+
+def convert_survey_csv_to_markdown(csv_path, output_dir, chunksize=None):
     """
     Convert a survey CSV file to Markdown format
+
+    Pass chunksize to read very large CSVs in pieces instead of in one go.
     """
     csv_path = Path(csv_path)
     output_dir = Path(output_dir)
@@ -377,22 +532,35 @@ def convert_survey_csv_to_markdown(csv_path, output_dir):
     
     try:
         print("Reading CSV file...")
-        df = pd.read_csv(csv_path, encoding='utf-8')
-        
+        # Everything gets stringified downstream anyway, so skip the parser's
+        # dtype inference and NaN conversion: cells come in as str, with
+        # empty cells as "" instead of float NaN.
+        read_kwargs = dict(
+            encoding='utf-8', dtype=str, engine='c',
+            na_filter=False, keep_default_na=False,
+        )
+        if chunksize:
+            df = pd.concat(
+                pd.read_csv(csv_path, chunksize=chunksize, **read_kwargs),
+                ignore_index=True,
+            )
+        else:
+            df = pd.read_csv(csv_path, **read_kwargs)
+
         print(f"Data loaded: {df.shape[0]} rows × {df.shape[1]} columns")
         print("Analyzing survey structure...")
         
         filename = csv_path.name
-        markdown_content = format_survey_csv_to_markdown(df, filename)
-        
         output_filename = csv_path.stem + '_SURVEY.md'
         output_path = output_dir / output_filename
-        
 
-        ## this will overwrite existing files. 
+
+        ## this will overwrite existing files.
         print(f"Writing survey markdown to: {output_path}")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
+        # Binary mode with a large block buffer: sections are encoded once
+        # and flushed in big writes
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            format_survey_csv_to_markdown(df, filename, _Utf8Writer(f))
         
         print(f"✅ Successfully converted survey data!")
         print(f"📁 Saved as: {output_filename}")